@@ -12,20 +12,27 @@ Then:
   - Predictive regressions with Newey–West SEs for overlap
 
 Dependencies:
-  pandas, numpy, statsmodels
+  pandas, numpy, statsmodels, pyarrow, numexpr, numba
 """
 
 # ====== Imports ======
+import glob
+import hashlib
+import inspect
+import os
+
 import pandas as pd
 import numpy as np
-from statsmodels.api import OLS, add_constant
-from statsmodels.stats.sandwich_covariance import cov_hac, se_cov
+import numexpr as ne
+from numba import njit
+from statsmodels.api import add_constant
 
 # ====== USER INPUTS (file paths & column names) ===============================
 # Your CSVs (already on disk)
 PATH_SPOT    = "Data/Daily_Spot_Prices_G10_FX_Pairs_Daily_2000_2025.csv"
 PATH_FWDPTS  = "Data/forwards.csv"                 # contains AUDJPY 1M forward POINTS (JPY pips)
 PATH_RR      = "Data/RR_Data.csv"                  # contains AUDJPY 1M 25Δ RR
+CACHE_DIR    = "Data/.cache"                       # Parquet cache of the cleaned weekly frame
 
 # Column names (as they appear in your files)
 COL_AUDUSD_DATE   = "AUDUSD - Date"
@@ -45,124 +52,251 @@ HORIZON_WEEKS       = 4         # next-4-week (≈ month) return target
 WARNING_QUANTILE    = 0.10      # bottom 10% dfear as "warning"
 MIN_EXPANDING_WEEKS = 52        # start z-scores after ~1 year
 
-# ====== 1) LOAD DATA =========================================================
-spot_df   = pd.read_csv(PATH_SPOT)
-fwdpts_df = pd.read_csv(PATH_FWDPTS)
-rr_df     = pd.read_csv(PATH_RR)
-
-# ====== 2) BUILD AUDJPY SPOT FROM AUDUSD * USDJPY ============================
-# Rename for clarity and keep only what's needed
-spot_df = spot_df.rename(columns={
-    COL_AUDUSD_DATE: "AUDUSD_Date",
-    COL_AUDUSD_LAST: "AUDUSD",
-    COL_USDJPY_DATE: "USDJPY_Date",
-    COL_USDJPY_LAST: "USDJPY",
-})
-
-spot_df = spot_df[["AUDUSD_Date", "AUDUSD", "USDJPY_Date", "USDJPY"]].copy()
-spot_df["Date"] = pd.to_datetime(spot_df["AUDUSD_Date"], errors="coerce")
-
-# Basic cleaning
-spot_df = spot_df.drop(columns=["AUDUSD_Date", "USDJPY_Date"])
-spot_df = spot_df.dropna(subset=["Date", "AUDUSD", "USDJPY"])
-
-# AUDJPY (JPY per AUD) = (USD per AUD) * (JPY per USD)
-spot_df["AUDJPY_spot"] = spot_df["AUDUSD"].astype(float) * spot_df["USDJPY"].astype(float)
-
-# Keep tidy weekly index
-audjpy_spot_w = (
-    spot_df[["Date", "AUDJPY_spot"]]
-    .sort_values("Date")
-    .drop_duplicates("Date")
-    .set_index("Date")
-    .resample(WEEKLY_FREQ)
-    .last()
-)
-
-# ====== 3) CONVERT AUDJPY 1M FORWARD POINTS -> OUTRIGHT FORWARD ==============
-# Your series is in JPY *pips* (e.g., -54.31 means -0.5431 JPY)
-fwdpts_df = fwdpts_df.rename(columns={
-    COL_AUDJPY_FWDPTS_DATE: "Date",
-    COL_AUDJPY_FWDPTS_VAL:  "AUDJPY_1M_points_pips",
-})
-fwdpts_df["Date"] = pd.to_datetime(fwdpts_df["Date"], errors="coerce")
-
-audjpy_pts_w = (
-    fwdpts_df[["Date", "AUDJPY_1M_points_pips"]]
-    .sort_values("Date")
-    .drop_duplicates("Date")
-    .set_index("Date")
-    .resample(WEEKLY_FREQ)
-    .last()
-)
-
-# Replace zeros (likely “missing after export”) with NaN BEFORE math
-audjpy_pts_w["AUDJPY_1M_points_pips"] = (
-    audjpy_pts_w["AUDJPY_1M_points_pips"].astype(float).replace(0.0, np.nan)
-)
-
-# Join spot & points on same weeks
-audjpy_df = audjpy_spot_w.join(audjpy_pts_w, how="inner")
-
-# Convert pips -> price units: 1 pip = 0.01 JPY (for JPY crosses)
-audjpy_df["AUDJPY_1M_points_price"] = audjpy_df["AUDJPY_1M_points_pips"] / 100.0
-
-# Outright 1M forward = spot + points_in_price_units
-audjpy_df["AUDJPY_1M_forward"] = (
-    audjpy_df["AUDJPY_spot"] + audjpy_df["AUDJPY_1M_points_price"]
-)
-
-# ====== 4) LOAD RR AND BUILD FEAR SIGNAL ====================================
-rr_df = rr_df.rename(columns={
-    COL_AUDJPY_RR_DATE: "Date",
-    COL_AUDJPY_RR_VAL:  "AUDJPY_RR25D",
-})
-rr_df["Date"] = pd.to_datetime(rr_df["Date"], errors="coerce")
-
-audjpy_rr_w = (
-    rr_df[["Date", "AUDJPY_RR25D"]]
-    .dropna()
-    .sort_values("Date")
-    .drop_duplicates("Date")
-    .set_index("Date")
-    .resample(WEEKLY_FREQ)
-    .last()
-)
-
-# Merge everything & drop any remaining NaNs in critical fields
-audjpy_df = (
-    audjpy_df
-    .join(audjpy_rr_w, how="inner")
-    .dropna(subset=["AUDJPY_spot", "AUDJPY_1M_forward", "AUDJPY_RR25D"])
+# ====== HELPERS ==============================================================
+# Numba kernels live at module level with cache=True: compiled code is written to
+# __pycache__ on the first run and loaded directly on later runs (no JIT startup)
+@njit(cache=True, fastmath=True)
+def nw_meat(U, L):
+    """Bartlett-weighted HAC meat S = Γ_0 + Σ_l (1 - l/(L+1)) (Γ_l + Γ_l').
+
+    U is a stack of score matrices X*resid with shape (M, N, K); returns (M, K, K).
+    """
+    M, N, K = U.shape
+    S = np.zeros((M, K, K), dtype=U.dtype)
+    w = np.empty(L + 1, dtype=U.dtype)          # weights in U's precision
+    for l in range(L + 1):
+        w[l] = 1.0 - l / (L + 1.0)
+    for m in range(M):
+        for l in range(L + 1):
+            for t in range(l, N):
+                for i in range(K):
+                    for j in range(K):
+                        g = U[m, t, i] * U[m, t - l, j]
+                        if l == 0:
+                            S[m, i, j] += g
+                        else:
+                            S[m, i, j] += w[l] * g
+                            S[m, j, i] += w[l] * g
+    return S
+
+
+@njit(cache=True, fastmath=True)
+def evt_stats(r, m):
+    """One pass over r: (mean | m, share < 0 | m, mean | ~m); NaN for an empty group."""
+    sw = cw = hw = sn = cn = 0.0
+    for i in range(r.size):
+        if m[i]:
+            sw += r[i]
+            cw += 1.0
+            if r[i] < 0:
+                hw += 1.0
+        else:
+            sn += r[i]
+            cn += 1.0
+    avg_w = sw / cw if cw > 0 else np.nan
+    hit_w = hw / cw if cw > 0 else np.nan
+    avg_n = sn / cn if cn > 0 else np.nan
+    return avg_w, hit_w, avg_n
+
+
+def nested_ols_nw(X, y, subsets, nlags):
+    """OLS + Newey–West covariance for several column subsets of one design.
+
+    X'X and X'y are formed once and sliced per model; residuals for all models
+    come from one matmul and go through nw_meat in a single batched call. Each
+    model's meat is the sub-block of the full-width meat built from its own
+    residuals. Covariances match statsmodels' cov_hac, including its
+    nobs/(nobs-k) small-sample correction (up to the float32 meat).
+
+    Returns a list of (beta, cov) in the order of `subsets`.
+    """
+    N, K = X.shape
+    XtX = X.T @ X
+    Xty = X.T @ y
+
+    B = np.zeros((K, len(subsets)))             # zero rows for excluded columns
+    for m, cols in enumerate(subsets):
+        B[cols, m] = np.linalg.solve(XtX[np.ix_(cols, cols)], Xty[cols])
+    resid = y[:, None] - X @ B
+
+    # Only the t-stats depend on the meat, so the lag loop runs in float32;
+    # coefficients above stay float64
+    U = np.ascontiguousarray(X[None, :, :] * resid.T[:, :, None], dtype=np.float32)
+    S = nw_meat(U, nlags).astype(np.float64)
+
+    out = []
+    for m, cols in enumerate(subsets):
+        XtX_inv = np.linalg.inv(XtX[np.ix_(cols, cols)])
+        cov = XtX_inv @ S[m][np.ix_(cols, cols)] @ XtX_inv * (N / (N - len(cols)))
+        out.append((B[cols, m], cov))
+    return out
+
+
+def build_weekly_frame():
+    """Load the three daily CSVs and return the cleaned weekly AUDJPY frame."""
+    # ====== 1) LOAD DATA =========================================================
+    # PyArrow's multithreaded reader, materializing only the columns we use;
+    # the ISO (YYYY-MM-DD) date columns are parsed natively at read time
+    spot_df = pd.read_csv(
+        PATH_SPOT,
+        engine="pyarrow",
+        usecols=[COL_AUDUSD_DATE, COL_AUDUSD_LAST, COL_USDJPY_LAST],
+        parse_dates=[COL_AUDUSD_DATE],
+        dtype={COL_AUDUSD_LAST: "float64", COL_USDJPY_LAST: "float64"},
+    )
+    fwdpts_df = pd.read_csv(
+        PATH_FWDPTS,
+        engine="pyarrow",
+        usecols=[COL_AUDJPY_FWDPTS_DATE, COL_AUDJPY_FWDPTS_VAL],
+        parse_dates=[COL_AUDJPY_FWDPTS_DATE],
+        dtype={COL_AUDJPY_FWDPTS_VAL: "float64"},
+    )
+    rr_df = pd.read_csv(
+        PATH_RR,
+        engine="pyarrow",
+        usecols=[COL_AUDJPY_RR_DATE, COL_AUDJPY_RR_VAL],
+        parse_dates=[COL_AUDJPY_RR_DATE],
+        dtype={COL_AUDJPY_RR_VAL: "float64"},
+    )
+
+    # ====== 2) BUILD AUDJPY SPOT FROM AUDUSD * USDJPY ============================
+    # Rename for clarity (only the needed columns were loaded)
+    spot_df = spot_df.rename(columns={
+        COL_AUDUSD_DATE: "Date",
+        COL_AUDUSD_LAST: "AUDUSD",
+        COL_USDJPY_LAST: "USDJPY",
+    })
+
+    # Basic cleaning
+    spot_df = spot_df.dropna(subset=["Date", "AUDUSD", "USDJPY"])
+
+    # AUDJPY (JPY per AUD) = (USD per AUD) * (JPY per USD)
+    # Values are already float64 from read_csv(dtype=...); no astype copies needed
+    # (these asserts are stripped under `python -O`)
+    assert (spot_df[["AUDUSD", "USDJPY"]].dtypes == np.float64).all()
+    spot_df["AUDJPY_spot"] = spot_df["AUDUSD"] * spot_df["USDJPY"]
+
+    # ====== 3) CONVERT AUDJPY 1M FORWARD POINTS -> OUTRIGHT FORWARD ==============
+    # Your series is in JPY *pips* (e.g., -54.31 means -0.5431 JPY)
+    fwdpts_df = fwdpts_df.rename(columns={
+        COL_AUDJPY_FWDPTS_DATE: "Date",
+        COL_AUDJPY_FWDPTS_VAL:  "AUDJPY_1M_points_pips",
+    })
+    assert fwdpts_df["AUDJPY_1M_points_pips"].dtype == np.float64   # no astype needed below
+
+    # ====== 4) LOAD RR AND ALIGN ALL FEEDS WEEKLY ===============================
+    rr_df = rr_df.rename(columns={
+        COL_AUDJPY_RR_DATE: "Date",
+        COL_AUDJPY_RR_VAL:  "AUDJPY_RR25D",
+    })
+    assert rr_df["AUDJPY_RR25D"].dtype == np.float64                # no astype needed below
+
+    # Align the daily feeds on a Friday grid with backward as-of joins: each
+    # Friday takes the feed's last observation in the week ending that Friday
+    # (Sat..Fri, as in a W-FRI resample). Sorted joins, no resample/hash join.
+    fridays = pd.date_range(
+        spot_df["Date"].min(), spot_df["Date"].max() + pd.Timedelta(days=6),
+        freq=WEEKLY_FREQ, unit="ns",
+    )
+    audjpy_df = pd.DataFrame({"Date": fridays})
+    for feed, col in [
+        (spot_df,   "AUDJPY_spot"),
+        (fwdpts_df, "AUDJPY_1M_points_pips"),
+        (rr_df,     "AUDJPY_RR25D"),
+    ]:
+        feed = feed[["Date", col]].dropna().sort_values("Date").drop_duplicates("Date")
+        feed["Date"] = feed["Date"].astype("datetime64[ns]")   # merge_asof needs matching units
+        audjpy_df = pd.merge_asof(
+            audjpy_df, feed, on="Date",
+            tolerance=pd.Timedelta(days=6), direction="backward",
+        )
+    audjpy_df = audjpy_df.set_index("Date")
+
+    # Points only feed the forward, so they live as local arrays, not columns.
+    # Replace zeros (likely “missing after export”) with NaN BEFORE math
+    points_pips = audjpy_df.pop("AUDJPY_1M_points_pips").to_numpy()
+    points_pips = np.where(points_pips == 0.0, np.nan, points_pips)
+
+    # Convert pips -> price units: 1 pip = 0.01 JPY (for JPY crosses)
+    points_price = points_pips / 100.0
+
+    # Outright 1M forward = spot + points_in_price_units
+    audjpy_df["AUDJPY_1M_forward"] = audjpy_df["AUDJPY_spot"].to_numpy() + points_price
+
+    # Drop any remaining NaNs in critical fields (weeks missing from any feed)
+    audjpy_df = audjpy_df.dropna(subset=["AUDJPY_spot", "AUDJPY_1M_forward", "AUDJPY_RR25D"])
+
+    return audjpy_df
+
+
+# ====== WEEKLY FRAME CACHE ===================================================
+# Reruns skip CSV parsing: the cleaned weekly frame is stored as Parquet, keyed
+# on the source files' paths, sizes and modification times, the user inputs the
+# builder reads (column names, WEEKLY_FREQ) and the builder's source, so that
+# editing any of them invalidates it
+_src_key = repr((
+    [(p, os.path.getsize(p), os.path.getmtime(p)) for p in (PATH_SPOT, PATH_FWDPTS, PATH_RR)],
+    (
+        COL_AUDUSD_DATE, COL_AUDUSD_LAST, COL_USDJPY_LAST,
+        COL_AUDJPY_FWDPTS_DATE, COL_AUDJPY_FWDPTS_VAL,
+        COL_AUDJPY_RR_DATE, COL_AUDJPY_RR_VAL,
+        WEEKLY_FREQ,
+    ),
+    inspect.getsource(build_weekly_frame),
+))
+CACHE_PATH = os.path.join(
+    CACHE_DIR, f"audjpy_weekly_{hashlib.sha1(_src_key.encode()).hexdigest()[:16]}.parquet"
 )
-
+if os.path.exists(CACHE_PATH):
+    audjpy_df = pd.read_parquet(CACHE_PATH)
+else:
+    audjpy_df = build_weekly_frame()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write to a temp file and rename into place, so an interrupted run never
+    # leaves a truncated Parquet behind; then prune caches from older keys
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    audjpy_df.to_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, CACHE_PATH)
+    for stale in glob.glob(os.path.join(CACHE_DIR, "audjpy_weekly_*.parquet")):
+        if os.path.abspath(stale) != os.path.abspath(CACHE_PATH):
+            os.remove(stale)
+
+# ---- Fear signal (step 4 continued) ----
+# Intermediates below are local arrays; only fear_z, dfear, ret_total_w and
+# ret_next_h are added to audjpy_df
 # Higher = more fear. For JPY crosses, more negative RR = puts expensive => multiply by -1
-audjpy_df["fear_level"] = -audjpy_df["AUDJPY_RR25D"].astype(float)
+x   = -audjpy_df["AUDJPY_RR25D"].to_numpy()   # fear level
 
 # Expanding z-score (avoids look-ahead): start after MIN_EXPANDING_WEEKS
-exp_mean = audjpy_df["fear_level"].expanding(min_periods=MIN_EXPANDING_WEEKS).mean()
-exp_std  = audjpy_df["fear_level"].expanding(min_periods=MIN_EXPANDING_WEEKS).std()
-audjpy_df["fear_z"] = (audjpy_df["fear_level"] - exp_mean) / exp_std
+# Single pass over cumulative sums instead of two pandas expanding() windows
+n   = np.arange(1, len(x) + 1)
+s1  = np.cumsum(x)
+s2  = np.cumsum(x * x)
+mu  = s1 / n
+with np.errstate(divide="ignore", invalid="ignore"):
+    var = (s2 - n * mu * mu) / (n - 1)          # Bessel-corrected, like pandas .std()
+sd  = np.sqrt(np.clip(var, 0.0, None))
+sd[n < MIN_EXPANDING_WEEKS] = np.nan
+audjpy_df["fear_z"] = pd.Series((x - mu) / sd, index=audjpy_df.index)
 
 # Weekly change in fear (steepening); this is the predictive variable that usually matters
 audjpy_df["dfear"] = audjpy_df["fear_z"].diff()
 
 # ====== 5) COMPUTE WEEKLY RETURNS ============================================
-# Spot weekly return (percentage)
-audjpy_df["ret_spot_w"] = audjpy_df["AUDJPY_spot"].pct_change()
-
-# Annualized carry yield from forward vs spot:
-# carry_yield_annual ~ ((F - S) / S) * 12  (12 months in a year)
-audjpy_df["carry_yield_annual"] = (
-    (audjpy_df["AUDJPY_1M_forward"] - audjpy_df["AUDJPY_spot"])
-    / audjpy_df["AUDJPY_spot"]
-) * 12.0
-
-# Weekly carry approx = annual carry / 52
-audjpy_df["ret_carry_w"] = audjpy_df["carry_yield_annual"] / 52.0
-
-# Total weekly return ≈ spot move + carry
-audjpy_df["ret_total_w"] = (audjpy_df["ret_spot_w"] + audjpy_df["ret_carry_w"])
+# Spot weekly return (percentage): S_t / S_{t-1} - 1 on the raw array
+spot = audjpy_df["AUDJPY_spot"].to_numpy()
+ret_spot = np.empty_like(spot)
+ret_spot[0] = np.nan
+np.divide(spot[1:], spot[:-1], out=ret_spot[1:])
+ret_spot[1:] -= 1.0
+
+# Total weekly return ≈ spot move + carry, fused into one numexpr pass:
+#   carry_yield_annual ~ ((F - S) / S) * 12  (12 months in a year)
+#   weekly carry       ~ carry_yield_annual / 52
+F = audjpy_df["AUDJPY_1M_forward"].to_numpy()
+S = audjpy_df["AUDJPY_spot"].to_numpy()
+R = ret_spot
+audjpy_df["ret_total_w"] = ne.evaluate("(F - S) / S * (12.0 / 52.0) + R")
 
 # Optional sanity check (uncomment to inspect)
 # print(audjpy_df[["AUDJPY_spot","AUDJPY_1M_forward","ret_total_w"]].describe(percentiles=[.01,.05,.5,.95,.99]))
@@ -170,23 +304,34 @@ audjpy_df["ret_total_w"] = (audjpy_df["ret_spot_w"] + audjpy_df["ret_carry_w"])
 # ====== 6) TARGET = NEXT 4-WEEK (≈ MONTHLY) RETURN ===========================
 # Rolling sum of next HORIZON_WEEKS returns, shifted so that predictors at t map to returns t+1..t+H
 h = HORIZON_WEEKS
-audjpy_df["ret_next_h"] = audjpy_df["ret_total_w"].rolling(h).sum().shift(-h+1)
-
-# Build aligned dataset and drop NaNs from early expanding windows / diffs
-aligned = audjpy_df[["ret_total_w", "fear_z", "dfear", "ret_next_h"]].dropna().copy()
-aligned = aligned.rename(columns={
-    "ret_total_w": "ret_w",
-    "ret_next_h":  "ret_next_h",
-})
+r   = audjpy_df["ret_total_w"].to_numpy()
+out = np.full_like(r, np.nan)                           # trailing h-1 weeks stay NaN
+if len(r) >= h:                                         # fewer than h weeks: all NaN
+    win = np.lib.stride_tricks.sliding_window_view(r, h)   # row t = weeks t..t+h-1
+    out[:len(win)] = win.sum(axis=1)
+audjpy_df["ret_next_h"] = out
+
+# Build aligned dataset as one (N, 4) matrix and drop rows with NaNs from early
+# expanding windows / diffs / the trailing target window (one mask, one copy)
+# Columns: 0 = ret_w, 1 = fear_z, 2 = dfear, 3 = ret_next_h
+M = np.stack([
+    audjpy_df["ret_total_w"].to_numpy(),
+    audjpy_df["fear_z"].to_numpy(),
+    audjpy_df["dfear"].to_numpy(),
+    audjpy_df["ret_next_h"].to_numpy(),
+], axis=1)
+M = M[np.isfinite(M).all(axis=1)]
 
 # ====== 7) EVENT STUDY =======================================================
 # Define "warning" as bottom WARNING_QUANTILE of dfear (largest *negative* change = steepening toward puts)
-q = aligned["dfear"].quantile(WARNING_QUANTILE)
-warning_mask = aligned["dfear"] <= q
+# Introselect instead of a full sort. With k = floor(q*(N-1)), `d <= d_(k)`
+# selects the same weeks as `d <= d.quantile(q)` under linear interpolation.
+d = M[:, 2]
+k = int(WARNING_QUANTILE * (len(d) - 1))
+q = np.partition(d, k)[k]
+warning_mask = d <= q
 
-evt_avg_warning   = aligned.loc[warning_mask,  "ret_next_h"].mean()
-evt_hit_warning   = (aligned.loc[warning_mask,  "ret_next_h"] < 0).mean()
-evt_avg_nowarning = aligned.loc[~warning_mask, "ret_next_h"].mean()
+evt_avg_warning, evt_hit_warning, evt_avg_nowarning = evt_stats(M[:, 3], warning_mask)
 
 print("Event study (AUDJPY):")
 print(f"  Avg next-{h}w return | warning weeks: {evt_avg_warning:.4%}")
@@ -194,33 +339,34 @@ print(f"  Hit rate (<0)        | warning weeks: {evt_hit_warning:.1%}")
 print(f"  Avg next-{h}w return | non-warning  : {evt_avg_nowarning:.4%}")
 
 # ====== 8) PREDICTIVE REGRESSIONS (Newey–West SEs for overlap) ===============
-y  = aligned["ret_next_h"]
+y = M[:, 3]
+
+# Both models are nested in one design [const, fear_z, dfear]; fit them together
+X_names = pd.Index(["const", "fear_z", "dfear"])
+X = add_constant(M[:, 1:3])
+(beta1, nw_cov1), (beta2, nw_cov2) = nested_ols_nw(
+    X, y, [[0, 2], [0, 1, 2]], h-1   # lag = horizon-1 for overlapping sums
+)
 
 # (a) Using dfear only
-X1 = add_constant(aligned[["dfear"]])
-ols1 = OLS(y, X1, missing="drop").fit()
-nw_cov1 = cov_hac(ols1, nlags=h-1)         # lag = horizon-1 for overlapping sums
-nw_se1  = se_cov(nw_cov1)
-tstats1 = ols1.params / nw_se1
+params1 = pd.Series(beta1, index=X_names[[0, 2]])
+tstats1 = params1 / np.sqrt(np.diag(nw_cov1))
 
 print(f"\nRegression: ret_next_{h}w ~ dfear (AUDJPY)")
-print("Params:\n", ols1.params)
+print("Params:\n", params1)
 print("Newey–West t-stats:\n", tstats1)
 
 # (b) Level of fear + change in fear
-X2 = add_constant(aligned[["fear_z", "dfear"]])
-ols2 = OLS(y, X2, missing="drop").fit()
-nw_cov2 = cov_hac(ols2, nlags=h-1)
-nw_se2  = se_cov(nw_cov2)
-tstats2 = ols2.params / nw_se2
+params2 = pd.Series(beta2, index=X_names)
+tstats2 = params2 / np.sqrt(np.diag(nw_cov2))
 
 print(f"\nRegression: ret_next_{h}w ~ fear_z + dfear (AUDJPY)")
-print("Params:\n", ols2.params)
+print("Params:\n", params2)
 print("Newey–West t-stats:\n", tstats2)
 
 # ====== 9) OPTIONAL: DIAGNOSTIC PRINTS =======================================
 # Uncomment to quickly eyeball units & scales
 # print("\nSanity check — first rows (spot vs forward):")
-# print(audjpy_df[["AUDJPY_spot","AUDJPY_1M_points_pips","AUDJPY_1M_points_price","AUDJPY_1M_forward"]].head(10))
+# print(audjpy_df[["AUDJPY_spot","AUDJPY_1M_forward"]].head(10))
 # print("\nWeekly return distribution:")
-# print(aligned["ret_w"].describe(percentiles=[0.01,0.05,0.5,0.95,0.99]))
\ No newline at end of file
+# print(pd.Series(M[:, 0]).describe(percentiles=[0.01,0.05,0.5,0.95,0.99]))
\ No newline at end of file